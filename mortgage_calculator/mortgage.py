@@ -1,10 +1,135 @@
 """ Utilities for comparing mortgages with different rates, terms, fees etc."""
 
+import math
+from bisect import bisect_left
+from functools import wraps
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional, it's only needed for batch calculations.
+    np = None
+
+
+def _jit(func, **kwargs):
+    """JIT compile the function with numba.njit if numba is installed, otherwise return it
+    unchanged. numba is imported here rather than with the module as it's slow to import,
+    and it's only needed for the month-by-month kernels and make_specialized."""
+    try:
+        from numba import njit
+    except ImportError:
+        return func
+    return njit(**kwargs)(func)
+
+
+def _jit_on_first_call(func):
+    """Decorator that JIT compiles the function (with numba's cache) the first time it's called."""
+    compiled = None
+
+    @wraps(func)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            compiled = _jit(func, cache=True)
+        return compiled(*args)
+
+    return wrapper
+
+
+# Source for the functions made by Mortgage.make_specialized, with the term in months filled in.
+_SPECIALIZED_TEMPLATE = '''
+def mortgage_{nterm}_months(loan, rate, fee, borrowfee, npayments):
+    """Get the monthly repayment and remaining loan after npayments for a {nterm} month mortgage."""
+    if borrowfee:
+        loan = loan + fee
+    # As _repayment and _remaining_loan, with expm1 to avoid cancellation at small rates.
+    lograte = math.log1p(rate / 100.0) / 12
+    if lograte == 0.0:
+        repayment = loan / {nterm}
+        return repayment, loan - repayment * npayments
+    qm1 = math.expm1(lograte)
+    repayment = loan * math.exp({nterm} * lograte) * qm1 / math.expm1({nterm} * lograte)
+    return repayment, loan * math.exp(npayments * lograte) - repayment * math.expm1(npayments * lograte) / qm1
+'''
+
+
+# These kernels only back the iterate=True verification paths, the closed forms being the default,
+# so they're JIT compiled with numba when it's available rather than built ahead of time with cython.
+@_jit_on_first_call
+def _remaining_loan_kernel(loan, rate, repayment, npayments):
+    """Apply the given number of monthly payments to the loan, month by month.
+    Interest is applied before each payment."""
+    for _ in range(npayments):
+        # Would be this if the first payment comes off before interest is applied.
+        # loan = (loan - repayment) * rate
+        loan = loan * rate - repayment
+    return loan
+
+
+def _repayment(loan, lograte, term):
+    """Get the monthly repayment that pays off the loan after the given number of months at
+    the monthly rate with the given log, using the closed form L0 q^N (q - 1)/(q^N - 1)."""
+    if lograte == 0.0:
+        return loan / term
+    return loan * math.exp(term * lograte) * math.expm1(lograte) / math.expm1(term * lograte)
+
+
+def _remaining_loan(loan, lograte, repayment, npayments, xp=math):
+    """Get the remaining loan after the given number of payments at the monthly rate with the
+    given log, using the closed form L0 q^N - P (q^N - 1)/(q - 1). expm1 avoids cancellation in
+    q^N - 1 and q - 1 at small rates. npayments can be a numpy array if xp is numpy rather than math."""
+    if lograte == 0.0:
+        return loan - repayment * npayments
+    return loan * xp.exp(npayments * lograte) - repayment * xp.expm1(npayments * lograte) / math.expm1(lograte)
+
+
+def _effective_loan(loan, repayment, npayments, rate):
+    """Get the remaining loan after the given number of payments at the given annual rate in %,
+    and its derivative with respect to the rate, using the closed form L0 q^N - P (q^N - 1)/(q - 1)."""
+    logq = math.log1p(rate / 100.0) / 12
+    q = math.exp(logq)
+    if q == 1.0:
+        dloan_dq = npayments * loan - repayment * npayments * (npayments - 1) / 2.0
+    else:
+        qn = math.exp(npayments * logq)
+        qm1 = math.expm1(logq)
+        dloan_dq = (
+            npayments * loan * qn / q - repayment * (npayments * qn / q * qm1 - math.expm1(npayments * logq)) / qm1**2
+        )
+    dq_drate = q / (12.0 * (rate + 100.0))
+    return _remaining_loan(loan, logq, repayment, npayments), dloan_dq * dq_drate
+
+
+@_jit_on_first_call
+def _calc_repayment_kernel(loan, rate, term):
+    """Calculate the monthly repayment by summing the geometric series term by term."""
+    total = 0.0
+    ratepow = 1.0
+    for _ in range(term):
+        total += ratepow
+        ratepow *= rate
+    return loan * ratepow / total
+
 
 class Mortgage(object):
     """Basic mortgage class."""
 
-    __slots__ = ("housevalue", "initloan", "loan", "rate", "term", "cashbalance", "repayment")
+    __slots__ = (
+        "housevalue",
+        "initloan",
+        "loan",
+        "_rate",
+        "_term",
+        "cashbalance",
+        "repayment",
+        "_log_rate",
+        "_rate_pow_term",
+        "_qm1",
+        "_qN_m1",
+        "_annual_rate_pct",
+        "_eff_rate_cache",
+    )
 
     def __init__(self, housevalue, loan, rate, term, fee, cashback=0.0, borrowfee=True, repayment: float | None = None):
         """housevalue : value of the house you're borrowing against in GBP (or any currency).
@@ -17,46 +142,161 @@ class Mortgage(object):
         """
 
         self.housevalue = housevalue
-        self.rate = (rate / 100.0 + 1.0) ** (1.0 / 12)
-        self.term = term * 12
+        self._term = round(term * 12)
+        # Set the log of the monthly rate from log1p, which is more precise at small rates than
+        # going through the rate setter.
+        self._log_rate = math.log1p(rate / 100.0) / 12
+        self._rate = math.exp(self._log_rate)
+        self._cache_rate_powers()
+        # Keep the annual rate for display rather than recomputing it from the monthly rate,
+        # as the rate setter does.
+        self._annual_rate_pct = rate
         self.initloan = float(loan)
-        self.loan = float(loan)
-        self.cashbalance = float(cashback)
-        if borrowfee:
-            self.loan += fee
-        else:
-            self.cashbalance -= fee
+        self.loan = self.initloan + (fee if borrowfee else 0.0)
+        self.cashbalance = float(cashback) - (0.0 if borrowfee else fee)
+        # Effective rates already calculated, by number of payments and the attributes they depend on.
+        self._eff_rate_cache = {}
 
         if repayment is None:
             self.calc_repayment()
         else:
             self.repayment = repayment
 
-    def calc_repayment(self):
+    @property
+    def rate(self):
+        """Monthly interest rate factor, eg, 1.0025 for 3 % a year. Setting it updates the
+        cached powers of the rate and the annual rate for display, and clears the cached
+        effective rates."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        self._rate = rate
+        self._log_rate = math.log(rate)
+        self._annual_rate_pct = math.expm1(12 * self._log_rate) * 100.0
+        self._cache_rate_powers()
+        # The remaining loans, and so the effective rates, depend on the rate.
+        self._eff_rate_cache.clear()
+
+    @property
+    def term(self):
+        """Term in months. Setting it updates the cached powers of the rate."""
+        return self._term
+
+    @term.setter
+    def term(self, term):
+        self._term = term
+        self._cache_rate_powers()
+
+    def _cache_rate_powers(self):
+        """Cache powers of the monthly rate that are reused, and the numerator and denominator
+        of the geometric series sum (q^N - 1)/(q - 1). Powers are calculated as exp(N log(q))
+        with log(q) cached, and expm1 avoids cancellation in q - 1 and q^N - 1 at small rates."""
+        self._rate_pow_term = math.exp(self._term * self._log_rate)
+        self._qm1 = math.expm1(self._log_rate)
+        self._qN_m1 = math.expm1(self._term * self._log_rate)
+
+    @classmethod
+    def batch(cls, housevalue, loan, rate, term, fee, cashback=0.0, borrowfee=True, npayments=None):
+        """Calculate many mortgages at once. Takes the same arguments as the constructor,
+        any of which can be arrays (broadcast against each other), and returns a dict of
+        arrays with the same names as the attributes of Mortgage. If npayments is given,
+        the dict also contains the 'remaining_loan' after that many payments. Requires numpy."""
+
+        if np is None:
+            raise ImportError("Mortgage.batch requires numpy")
+
+        initloan = np.asarray(loan, dtype=float)
+        fee = np.asarray(fee, dtype=float)
+        borrowfee = np.asarray(borrowfee, dtype=bool)
+        # As for a single mortgage, the powers of the rate are calculated from the log of the
+        # monthly rate, with expm1 to avoid cancellation in q - 1 and q^N - 1 at small rates.
+        lograte = np.log1p(np.asarray(rate, dtype=float) / 100.0) / 12
+        nterm = np.round(np.asarray(term) * 12).astype(int)
+        loaneff = initloan + np.where(borrowfee, fee, 0.0)
+        cashbalance = np.asarray(cashback, dtype=float) - np.where(borrowfee, 0.0, fee)
+        zerorate = lograte == 0.0
+        # Avoid dividing by zero for zero rates, which are replaced with the linear limit.
+        qm1safe = np.where(zerorate, 1.0, np.expm1(lograte))
+        qNm1safe = np.where(zerorate, 1.0, np.expm1(nterm * lograte))
+
+        repayment = np.where(zerorate, loaneff / nterm, loaneff * np.exp(nterm * lograte) * qm1safe / qNm1safe)
+        result = {
+            "housevalue": np.asarray(housevalue, dtype=float),
+            "initloan": initloan,
+            "loan": loaneff,
+            "rate": np.exp(lograte),
+            "term": nterm,
+            "cashbalance": cashbalance,
+            "repayment": repayment,
+        }
+        if npayments is not None:
+            npayments = np.asarray(npayments)
+            result["remaining_loan"] = np.where(
+                zerorate,
+                loaneff - repayment * npayments,
+                loaneff * np.exp(npayments * lograte) - repayment * np.expm1(npayments * lograte) / qm1safe,
+            )
+        return result
+
+    @staticmethod
+    def make_specialized(term):
+        """Make a function f(loan, rate, fee, borrowfee, npayments) -> (repayment, remaining loan)
+        for mortgages with the given term in years, with the arguments as for the constructor.
+        The term is compiled in as a constant, which is faster for scanning over many mortgages
+        with the same term. The function is JIT compiled if numba is available."""
+
+        nterm = round(term * 12)
+        namespace = {"math": math}
+        src = _SPECIALIZED_TEMPLATE.format(nterm=nterm)
+        exec(compile(src, "<Mortgage.make_specialized({0})>".format(term), "exec"), namespace)
+        # Can't use numba's cache, since there's no source file.
+        return _jit(namespace["mortgage_{0}_months".format(nterm)])
+
+    def calc_repayment(self, iterate=False):
         """Calculate the monthly repayment. This reproduces within < 1 % what I get
         from online mortgage calculators. Possibly their definition of a month is
-        different. I use 1/12 of a year."""
+        different. I use 1/12 of a year.
+
+        iterate : sum the geometric series term by term rather than using its
+        closed form (slower, for verification)."""
 
         # Would be this if the first payment comes off before interest is applied.
         # self.repayment = self.loan * self.rate ** self.term \
         #                  / sum(self.rate**n for n in range(1, self.term+1))
 
-        # This if interest is applied before the first payment
-        self.repayment = self.loan * self.rate**self.term / sum(self.rate**n for n in range(0, self.term))
+        # This if interest is applied before the first payment, with
+        # sum(r**n for n in range(0, N)) = (r**N - 1)/(r - 1), or N if r == 1.
+        self._eff_rate_cache.clear()
+        if iterate:
+            self.repayment = _calc_repayment_kernel(self.loan, self.rate, self.term)
+        elif self._log_rate == 0.0:
+            self.repayment = self.loan / self.term
+        else:
+            self.repayment = self.loan * self._rate_pow_term * self._qm1 / self._qN_m1
 
-    def remaining_loan(self, npayments):
+    def remaining_loan(self, npayments, iterate=False):
         """Get the remaining loan after the given number of payments. Interest is applied
-        before each payment."""
-        loan = self.loan
-        for i in range(npayments):
-            # Would be this if the first payment comes off before interest is applied.
-            # loan -= self.repayment
-            # loan *= self.rate
-
-            # This if interest is applied before the first payment
-            loan *= self.rate
-            loan -= self.repayment
-        return loan
+        before each payment.
+
+        iterate : apply the payments month by month rather than using the closed
+        form L0 q^N - P (q^N - 1)/(q - 1) (slower, for verification)."""
+
+        if iterate:
+            return _remaining_loan_kernel(self.loan, self.rate, self.repayment, npayments)
+        # Don't short-cut to 0.0 at the end of the term: repayment, loan and rate are public and
+        # may have changed since calc_repayment, and the closed form is O(1) anyway.
+        if npayments == self.term and self._qm1 != 0.0:
+            return self.loan * self._rate_pow_term - self.repayment * self._qN_m1 / self._qm1
+        return _remaining_loan(self.loan, self._log_rate, self.repayment, npayments)
+
+    def amortization_schedule(self):
+        """Get a numpy array of the remaining loan after each number of payments from 0 up to
+        the term. Requires numpy."""
+
+        if np is None:
+            raise ImportError("amortization_schedule requires numpy")
+        return _remaining_loan(self.loan, self._log_rate, self.repayment, np.arange(self.term + 1), np)
 
     def effective_rate_after(self, npayments):
         """Get the effective interest rate after a certain number of payments
@@ -64,23 +304,59 @@ class Mortgage(object):
         This takes into account any fees and cashback, and whether you add the fees
         onto the loan or pay them up front."""
 
-        loan = self.remaining_loan(npayments) - self.cashbalance
-        effectiverate = 0.1
-        deltarate = 0.1
-        # Iterate, incrementing the rate, til we get the correct remaining loan
-        # after the given number of payments, given the initial loan (not including fees)
-        # and the monthly repayment.
+        # The attributes are public, so include them in the key in case they've been changed.
+        key = (npayments, self.repayment, self.initloan, self.loan, self.cashbalance)
+        if key in self._eff_rate_cache:
+            return self._eff_rate_cache[key]
+        target = self.remaining_loan(npayments) - self.cashbalance
+        # Solve for the rate that gives the correct remaining loan after the given number
+        # of payments, given the initial loan (not including fees) and the monthly repayment.
+        # First bracket the rate, starting from 0 - 20 % and widening til the residual
+        # changes sign. The remaining loan increases with the rate, and rates must be above -100 %.
+        lo, hi = 0.0, 20.0
+        reslo = _effective_loan(self.initloan, self.repayment, npayments, lo)[0] - target
+        reshi = _effective_loan(self.initloan, self.repayment, npayments, hi)[0] - target
+        for _ in range(50):
+            if reslo == 0.0 or reshi == 0.0 or (reslo < 0.0) != (reshi < 0.0):
+                break
+            if reslo > 0.0:
+                lo, hi, reshi = (lo - 100.0) / 2.0, lo, reslo
+                reslo = _effective_loan(self.initloan, self.repayment, npayments, lo)[0] - target
+            else:
+                lo, hi, reslo = hi, hi * 2.0, reshi
+                reshi = _effective_loan(self.initloan, self.repayment, npayments, hi)[0] - target
+        else:
+            raise ValueError("No rate gives the remaining loan after {0} payments".format(npayments))
+
+        # The rate can be exactly at the end of the bracket, eg, for a 0 % mortgage without fees.
+        if reslo == 0.0 or reshi == 0.0:
+            effectiverate = lo if reslo == 0.0 else hi
+            self._eff_rate_cache[key] = effectiverate
+            return effectiverate
+
+        # Then Newton-Raphson from the middle of the bracket, shrinking the bracket as we go,
+        # and bisecting instead whenever a Newton step would leave it.
+        effectiverate = (lo + hi) / 2.0
         while True:
-            meff = Mortgage(self.housevalue, self.initloan, effectiverate, self.term, 0.0)
-            meff.repayment = self.repayment
-            effloan = meff.remaining_loan(npayments)
-            if effloan < loan:
-                effectiverate += deltarate
+            effloan, derivative = _effective_loan(self.initloan, self.repayment, npayments, effectiverate)
+            residual = effloan - target
+            if residual == 0.0:
+                break
+            if (residual < 0.0) == (reslo < 0.0):
+                lo = effectiverate
+            else:
+                hi = effectiverate
+            if derivative == 0.0:
+                newrate = (lo + hi) / 2.0
             else:
-                effectiverate -= deltarate
-                deltarate /= 10.0
-                if deltarate == 1e-5:
-                    break
+                newrate = effectiverate - residual / derivative
+                if not lo < newrate < hi:
+                    newrate = (lo + hi) / 2.0
+            deltarate = newrate - effectiverate
+            effectiverate = newrate
+            if abs(deltarate) < 1e-6:
+                break
+        self._eff_rate_cache[key] = effectiverate
         return effectiverate
 
     def loan_to_value(self):
@@ -104,7 +380,7 @@ class Mortgage(object):
             "Loan/value",
             self.loan_to_value() * 100.0,
             "Rate [%]",
-            (self.rate**12 - 1.0) * 100.0,
+            self._annual_rate_pct,
             "Term [years]",
             self.term / 12.0,
             "Cash balance",
@@ -119,17 +395,18 @@ class Mortgage(object):
 
         if npayments == 0:
             npayments = self.term
-        summary = str(self)
         loan = self.remaining_loan(npayments)
         effrate = self.effective_rate_after(npayments)
         total_paid = self.repayment * npayments - self.cashbalance
-        summary += "\n - After " + str(npayments) + " payments:"
-        summary += """
-{0:<20} : {1:.2f}
+        summary = """{0}
+ - After {1} payments:
 {2:<20} : {3:.2f}
 {4:<20} : {5:.2f}
 {6:<20} : {7:.2f}
-{8:<20} : {9:.2f}""".format(
+{8:<20} : {9:.2f}
+{10:<20} : {11:.2f}""".format(
+            self,
+            npayments,
             "Remaining loan",
             loan,
             "Remaining loan/initial loan",
@@ -158,62 +435,120 @@ class MortgageSequence(Mortgage):
         is calculated as the total term minus the sum of terms of the preceding mortgages."""
 
         self.housevalue = float(housevalue)
-        self.term = term * 12
+        # Set directly, since the term setter would cache powers of a rate that isn't known yet.
+        self._term = term * 12
         self.initloan = float(loan)
         self.cashbalance = 0.0
-
-        self.mortgages = []
+        self._eff_rate_cache = {}
+
+        self._mortgageinfos = (mortgage1, mortgage2) + mortgages
+        self._mortgages = None
+        terms = [mortgageinfo["term"] * 12 for mortgageinfo in self._mortgageinfos[:-1]]
+        terms.append(self.term - sum(terms))
+
+        # Parameters of each mortgage as parallel tuples, with the number of payments made by the
+        # end of each mortgage, so the mortgage for a given payment can be found by bisection.
+        # The loan handed over to the next mortgage is calculated directly, without constructing
+        # Mortgage objects, which are only made if the mortgages attribute is used.
+        startloans, loans, logrates, repayments = [], [], [], []
         remainingterm = self.term
         remainingloan = self.initloan
 
-        for mortgageinfo in (mortgage1, mortgage2) + mortgages:
-            mortgage = Mortgage(
-                housevalue,
-                remainingloan,
-                mortgageinfo["rate"],
-                remainingterm / 12,
-                mortgageinfo["fee"],
-                mortgageinfo.get("cashback", 0.0),
-                mortgageinfo.get("borrowfee", True),
-            )
-            self.mortgages.append([mortgageinfo["term"] * 12, mortgage])
-            remainingterm -= mortgageinfo["term"] * 12
-            remainingloan = mortgage.remaining_loan(mortgageinfo["term"] * 12)
-            self.cashbalance += mortgage.cashbalance
-
-        self.loan = self.mortgages[0][1].loan
-
-        self.mortgages[-1][0] = self.term - sum(term for term, mort in self.mortgages[:-1])
+        for mortgageinfo, usedterm in zip(self._mortgageinfos, terms):
+            fee = mortgageinfo["fee"]
+            borrowfee = mortgageinfo.get("borrowfee", True)
+            mortgageloan = remainingloan + (fee if borrowfee else 0.0)
+            lograte = math.log1p(mortgageinfo["rate"] / 100.0) / 12
+            repayment = _repayment(mortgageloan, lograte, round(remainingterm))
+            self.cashbalance += mortgageinfo.get("cashback", 0.0) - (0.0 if borrowfee else fee)
+
+            startloans.append(remainingloan)
+            loans.append(mortgageloan)
+            logrates.append(lograte)
+            repayments.append(repayment)
+            remainingterm -= usedterm
+            remainingloan = _remaining_loan(mortgageloan, lograte, repayment, usedterm)
+
+        self._terms = tuple(terms)
+        self._cumterms = tuple(accumulate(self._terms))
+        self._startloans = tuple(startloans)
+        self._loans = tuple(loans)
+        self._logrates = tuple(logrates)
+        self._rates = tuple(math.exp(lograte) for lograte in logrates)
+        self._repayments = tuple(repayments)
+
+        self.loan = self._loans[0]
 
         self.calc_repayment()
 
-        self.rate = (self.effective_rate_after(self.term) / 100.0 + 1.0) ** (1.0 / 12)
+        self.rate = math.exp(math.log1p(self.effective_rate_after(self.term) / 100.0) / 12)
 
-    def calc_repayment(self):
+    def calc_repayment(self, iterate=False):
         """Calculate the average rate of the mortgages in the sequence, weighted
-        by their terms."""
-
+        by their terms.
+
+        iterate : recalculate the repayment of each mortgage by summing the geometric
+        series term by term rather than using its closed form (slower, for verification)."""
+
+        repayments = self._repayments
+        if iterate:
+            repayments = [
+                _calc_repayment_kernel(loan, rate, round(self.term - (cumterm - term)))
+                for term, cumterm, rate, loan in zip(self._terms, self._cumterms, self._rates, self._loans)
+            ]
+        self._eff_rate_cache.clear()
         self.repayment = 0.0
-        for term, mortgage in self.mortgages:
-            self.repayment += mortgage.repayment * term / self.term
-
-    def remaining_loan(self, npayments):
+        for term, repayment in zip(self._terms, repayments):
+            self.repayment += repayment * term / self.term
+
+    @property
+    def mortgages(self):
+        """List of [term used, Mortgage] for each mortgage in the sequence, made when first used."""
+
+        if self._mortgages is None:
+            self._mortgages = []
+            for i, (mortgageinfo, term) in enumerate(zip(self._mortgageinfos, self._terms)):
+                remainingterm = self.term - (self._cumterms[i - 1] if i > 0 else 0)
+                mortgage = Mortgage(
+                    self.housevalue,
+                    self._startloans[i],
+                    mortgageinfo["rate"],
+                    remainingterm / 12,
+                    mortgageinfo["fee"],
+                    mortgageinfo.get("cashback", 0.0),
+                    mortgageinfo.get("borrowfee", True),
+                )
+                self._mortgages.append([term, mortgage])
+        return self._mortgages
+
+    def remaining_loan(self, npayments, iterate=False):
         """Get the remaining loan after the given number of payments. Interest is applied
-        before each payment."""
+        before each payment.
+
+        iterate : apply the payments to the current mortgage month by month rather than
+        using the closed form (slower, for verification)."""
+
+        i = min(bisect_left(self._cumterms, npayments), len(self._cumterms) - 1)
+        remainingpayments = npayments - (self._cumterms[i - 1] if i > 0 else 0)
+        if iterate:
+            return _remaining_loan_kernel(self._loans[i], self._rates[i], self._repayments[i], round(remainingpayments))
+        return _remaining_loan(self._loans[i], self._logrates[i], self._repayments[i], remainingpayments)
+
+    def amortization_schedule(self):
+        """Get a numpy array of the remaining loan after each number of payments from 0 up to
+        the term. Requires numpy."""
 
-        remainingpayments = npayments
-        for term, mortgage in self.mortgages:
-            if remainingpayments - term <= 0:
-                return mortgage.remaining_loan(remainingpayments)
-            remainingpayments -= term
+        if np is None:
+            raise ImportError("amortization_schedule requires numpy")
+        schedule = [np.array([self._loans[0]])]
+        for term, lograte, repayment, loan in zip(self._terms, self._logrates, self._repayments, self._loans):
+            schedule.append(_remaining_loan(loan, lograte, repayment, np.arange(1, term + 1), np))
+        return np.concatenate(schedule)
 
     def __str__(self):
         """Get a human readable string reperesentation of the mortgage sequence."""
 
-        selfstr = Mortgage.__str__(self)
+        parts = [Mortgage.__str__(self)]
         for i, (term, mortgage) in enumerate(self.mortgages):
-            selfstr += "\n - Mortgage " + str(i)
-            selfstr += "\n{0:<20} : {1}\n".format("Term used", term / 12.0)
-            mortstr = str(mortgage)
-            selfstr += mortstr
-        return selfstr
+            parts.append(" - Mortgage {0}\n{1:<20} : {2}\n{3}".format(i, "Term used", term / 12.0, mortgage))
+        return "\n".join(parts)
@@ -0,0 +1,209 @@
+import pytest
+
+from mortgage_calculator import Mortgage, MortgageSequence
+
+VALUE = 150000
+LOAN = 125000
+TERM = 25
+
+MORTGAGES = [
+    dict(rate=1.69, fee=995.0),
+    dict(rate=2.29, fee=995.0, borrowfee=False),
+    dict(rate=3.24, fee=995.0, cashback=500.0),
+    dict(rate=0.0, fee=0.0),
+    dict(rate=1e-10, fee=0.0),
+]
+
+SEQUENCES = [
+    [{"rate": 1.69, "fee": 995, "term": 2}, {"rate": 3.99, "fee": 0.0, "term": 16}],
+    [{"rate": 1.69, "fee": 995, "term": 2}] * 3,
+    [{"rate": 1.69, "fee": 995, "term": 2}, {"rate": 0.0, "fee": 100.0, "term": 3, "borrowfee": False}],
+]
+
+
+def make_mortgage(rate, fee, **kwargs):
+    return Mortgage(VALUE, LOAN, rate, TERM, fee, **kwargs)
+
+
+@pytest.mark.parametrize("kwargs", MORTGAGES)
+def test_calc_repayment_closed_form(kwargs):
+    mortgage = make_mortgage(**kwargs)
+    repayment = mortgage.repayment
+    mortgage.calc_repayment(iterate=True)
+    assert repayment == pytest.approx(mortgage.repayment, rel=1e-10)
+
+
+def test_calc_repayment_small_rate():
+    mortgage = make_mortgage(1e-10, 0.0)
+    assert mortgage.repayment == pytest.approx(LOAN / mortgage.term, rel=1e-10)
+
+
+@pytest.mark.parametrize("kwargs", MORTGAGES)
+@pytest.mark.parametrize("npayments", [0, 1, 24, 60, 299, 300])
+def test_remaining_loan_closed_form(kwargs, npayments):
+    mortgage = make_mortgage(**kwargs)
+    assert mortgage.remaining_loan(npayments) == pytest.approx(
+        mortgage.remaining_loan(npayments, iterate=True), rel=1e-9, abs=1e-6
+    )
+
+
+def test_remaining_loan_after_changing_repayment():
+    mortgage = make_mortgage(3.0, 0.0)
+    mortgage.repayment = 500.0
+    assert mortgage.remaining_loan(mortgage.term) == pytest.approx(39974.82, abs=0.01)
+
+
+def test_calc_repayment_after_changing_term():
+    mortgage = make_mortgage(3.0, 0.0)
+    mortgage.term = 120
+    mortgage.calc_repayment()
+    assert mortgage.repayment == pytest.approx(1204.68, abs=0.01)
+    assert mortgage.remaining_loan(120) == pytest.approx(0.0, abs=1e-6)
+
+
+@pytest.mark.parametrize("npayments", [60, 300])
+def test_remaining_loan_after_changing_rate(npayments):
+    mortgage = make_mortgage(3.0, 0.0)
+    mortgage.rate = make_mortgage(4.0, 0.0).rate
+    assert mortgage.remaining_loan(npayments) == pytest.approx(
+        mortgage.remaining_loan(npayments, iterate=True), rel=1e-9
+    )
+
+
+def test_str_after_changing_rate():
+    mortgage = make_mortgage(3.0, 0.0)
+    mortgage.rate = make_mortgage(4.0, 0.0).rate
+    assert "Rate [%]             : 4.00\n" in str(mortgage)
+
+
+@pytest.mark.parametrize("mortgages", SEQUENCES)
+@pytest.mark.parametrize("npayments", [0, 1, 24, 25, 60, 299, 300])
+def test_sequence_remaining_loan_closed_form(mortgages, npayments):
+    sequence = MortgageSequence(VALUE, LOAN, TERM, *mortgages)
+    assert sequence.remaining_loan(npayments) == pytest.approx(
+        sequence.remaining_loan(npayments, iterate=True), rel=1e-9, abs=1e-6
+    )
+
+
+@pytest.mark.parametrize("mortgages", SEQUENCES)
+def test_sequence_matches_mortgages(mortgages):
+    sequence = MortgageSequence(VALUE, LOAN, TERM, *mortgages)
+    repayment = sequence.repayment
+    sequence.calc_repayment(iterate=True)
+    assert repayment == pytest.approx(sequence.repayment, rel=1e-10)
+
+    npayments = 0
+    for term, mortgage in sequence.mortgages:
+        npayments += term
+        assert sequence.remaining_loan(npayments) == mortgage.remaining_loan(term)
+
+
+# Effective rates from the original search, which was accurate to 1e-4.
+@pytest.mark.parametrize(
+    "rate, npayments, effrate",
+    [(1.69, 24, 2.1136), (2.29, 60, 2.4754), (3.24, 60, 3.4296)],
+)
+def test_effective_rate(rate, npayments, effrate):
+    mortgage = make_mortgage(rate, 995.0)
+    assert mortgage.effective_rate_after(npayments) == pytest.approx(effrate, abs=1e-4)
+
+
+@pytest.mark.parametrize(
+    "mortgages, npayments, effrate",
+    [(SEQUENCES[0], 60, 3.6455), (SEQUENCES[1], 60, 2.2644), (SEQUENCES[1], 300, 1.8935)],
+)
+def test_sequence_effective_rate(mortgages, npayments, effrate):
+    sequence = MortgageSequence(VALUE, LOAN, TERM, *mortgages)
+    assert sequence.effective_rate_after(npayments) == pytest.approx(effrate, abs=1e-4)
+
+
+@pytest.mark.parametrize("rate", [0.0, 2.0])
+def test_effective_rate_without_fees(rate):
+    mortgage = make_mortgage(rate, 0.0)
+    assert mortgage.effective_rate_after(60) == pytest.approx(rate, abs=1e-6)
+
+
+def test_effective_rate_at_bracket_endpoint():
+    mortgage = make_mortgage(0.0, 0.0)
+    assert mortgage.effective_rate_after(60) == 0.0
+
+
+def test_effective_rate_after_changing_cashbalance():
+    mortgage = make_mortgage(2.0, 0.0)
+    effrate = mortgage.effective_rate_after(60)
+    mortgage.cashbalance = 1000.0
+    assert mortgage.effective_rate_after(60) < effrate
+
+
+def test_effective_rate_after_changing_rate():
+    mortgage = make_mortgage(2.0, 0.0)
+    effrate = mortgage.effective_rate_after(60)
+    mortgage.rate = make_mortgage(3.0, 0.0).rate
+    assert mortgage.effective_rate_after(60) > effrate
+
+
+def test_effective_rate_not_found():
+    mortgage = make_mortgage(2.0, 0.0, cashback=LOAN)
+    with pytest.raises(ValueError):
+        mortgage.effective_rate_after(60)
+
+
+@pytest.mark.parametrize("kwargs", MORTGAGES)
+def test_make_specialized(kwargs):
+    mortgage = make_mortgage(**kwargs)
+    specialized = Mortgage.make_specialized(TERM)
+    repayment, remaining = specialized(LOAN, kwargs["rate"], kwargs["fee"], kwargs.get("borrowfee", True), 60)
+    assert repayment == pytest.approx(mortgage.repayment, rel=1e-10)
+    assert remaining == pytest.approx(mortgage.remaining_loan(60), rel=1e-9)
+
+
+def test_make_specialized_small_rate():
+    mortgage = make_mortgage(1e-6, 0.0)
+    repayment, remaining = Mortgage.make_specialized(TERM)(LOAN, 1e-6, 0.0, True, 60)
+    assert repayment == pytest.approx(mortgage.repayment, rel=1e-12)
+    assert remaining == pytest.approx(mortgage.remaining_loan(60), rel=1e-12)
+
+
+def test_batch():
+    np = pytest.importorskip("numpy")
+    rates = [kwargs["rate"] for kwargs in MORTGAGES]
+    fees = [kwargs["fee"] for kwargs in MORTGAGES]
+    cashbacks = [kwargs.get("cashback", 0.0) for kwargs in MORTGAGES]
+    borrowfees = [kwargs.get("borrowfee", True) for kwargs in MORTGAGES]
+    batch = Mortgage.batch(VALUE, LOAN, np.array(rates), TERM, fees, cashbacks, borrowfees, npayments=60)
+    assert batch["term"].dtype.kind == "i"
+    for i, kwargs in enumerate(MORTGAGES):
+        mortgage = make_mortgage(**kwargs)
+        assert batch["term"][()] == mortgage.term
+        assert batch["cashbalance"][i] == mortgage.cashbalance
+        assert batch["repayment"][i] == pytest.approx(mortgage.repayment, rel=1e-10)
+        assert batch["remaining_loan"][i] == pytest.approx(mortgage.remaining_loan(60), rel=1e-9)
+
+
+def test_batch_small_rate():
+    pytest.importorskip("numpy")
+    mortgage = make_mortgage(1e-6, 0.0)
+    batch = Mortgage.batch(VALUE, LOAN, [1e-6, 0.0], TERM, 0.0, npayments=60)
+    assert batch["rate"][0] == mortgage.rate
+    assert batch["repayment"][0] == pytest.approx(mortgage.repayment, rel=1e-12)
+    assert batch["remaining_loan"][0] == pytest.approx(mortgage.remaining_loan(60), rel=1e-12)
+
+
+@pytest.mark.parametrize("kwargs", MORTGAGES)
+def test_amortization_schedule(kwargs):
+    pytest.importorskip("numpy")
+    mortgage = make_mortgage(**kwargs)
+    schedule = mortgage.amortization_schedule()
+    assert len(schedule) == mortgage.term + 1
+    for npayments in (0, 1, 60, 300):
+        assert schedule[npayments] == pytest.approx(mortgage.remaining_loan(npayments), rel=1e-9, abs=1e-6)
+
+
+@pytest.mark.parametrize("mortgages", SEQUENCES)
+def test_sequence_amortization_schedule(mortgages):
+    pytest.importorskip("numpy")
+    sequence = MortgageSequence(VALUE, LOAN, TERM, *mortgages)
+    schedule = sequence.amortization_schedule()
+    assert len(schedule) == sequence.term + 1
+    for npayments in (0, 24, 25, 60, 300):
+        assert schedule[npayments] == pytest.approx(sequence.remaining_loan(npayments), rel=1e-9, abs=1e-6)